@@ -4,54 +4,127 @@
 # These are "mock" implementations, designed for clear demonstration of API structure
 # and readiness for integration, without requiring actual sensor inputs.
 
-from typing import List, Dict, Tuple, Optional
+import logging
+import sys
+from dataclasses import dataclass
+from typing import Iterable, List, Dict, Tuple, Optional
 import numpy as np # Used for representing images as NumPy arrays in API signatures
+import cv_postprocess # IoU / non-max suppression kernels for CV detection outputs
+import pose_ops # Vectorized kernels over RobotPoseArray batches
+
+# Module-level logger. Call sites check isEnabledFor(DEBUG) first and use %-style
+# arguments, so no message is formatted when debug logging is off.
+_log = logging.getLogger(__name__)
 
 # =========================================================================
 # Custom Data Types for API Interfaces
 # These classes define the structure of data exchanged via the APIs.
+# They are frozen, slotted dataclasses (Python 3.10+): no per-instance __dict__,
+# and instances are immutable once created. repr()/str() give a compact form;
+# the human-readable form is built only on demand via format().
 # =========================================================================
 
+@dataclass(slots=True, frozen=True, repr=False)
 class BoundingBox:
     """Represents a bounding box for detected objects/faces (x_min, y_min, x_max, y_max)."""
-    def __init__(self, x_min: int, y_min: int, x_max: int, y_max: int):
-        self.x_min = x_min
-        self.y_min = y_min
-        self.x_max = x_max
-        self.y_max = y_max
+    x_min: int
+    y_min: int
+    x_max: int
+    y_max: int
 
     def to_dict(self) -> Dict:
         return {"x_min": self.x_min, "y_min": self.y_min, "x_max": self.x_max, "y_max": self.y_max}
 
-    def __str__(self):
+    @staticmethod
+    def dict_from_xyxy(x_min: int, y_min: int, x_max: int, y_max: int) -> Dict:
+        """Returns the same dict as to_dict() directly from coordinates, without building an instance."""
+        return {"x_min": x_min, "y_min": y_min, "x_max": x_max, "y_max": y_max}
+
+    @classmethod
+    def from_row(cls, row: np.ndarray) -> "BoundingBox":
+        """Builds a BoundingBox from one (x_min, y_min, x_max, y_max) row of a detection bbox array."""
+        x_min, y_min, x_max, y_max = row
+        return cls(int(x_min), int(y_min), int(x_max), int(y_max))
+
+    def to_row(self) -> np.ndarray:
+        """Returns the box as a length-4 int32 array, matching one row of a detection bbox array."""
+        return np.array((self.x_min, self.y_min, self.x_max, self.y_max), dtype=np.int32)
+
+    def __repr__(self):
+        return "BoundingBox(%r,%r,%r,%r)" % (self.x_min, self.y_min, self.x_max, self.y_max)
+
+    def format(self) -> str:
         return f"BoundingBox(x_min={self.x_min}, y_min={self.y_min}, x_max={self.x_max}, y_max={self.y_max})"
 
 
+@dataclass(slots=True, frozen=True, repr=False)
 class RobotPose:
     """Represents the robot's 2D position and orientation (x, y, theta)."""
-    def __init__(self, x: float, y: float, theta: float):
-        self.x = x
-        self.y = y
-        self.theta = theta
+    x: float
+    y: float
+    theta: float
 
     def to_dict(self) -> Dict:
         return {"x": self.x, "y": self.y, "theta": self.theta}
 
-    def __str__(self):
+    def __repr__(self):
+        return "RobotPose(%.2f,%.2f,%.2f)" % (self.x, self.y, self.theta)
+
+    def format(self) -> str:
         return f"RobotPose(x={self.x:.2f}, y={self.y:.2f}, theta={self.theta:.2f})"
 
 
+class RobotPoseArray:
+    """
+    Represents a batch of N robot poses as one (N, 3) float32 array of (x, y, theta) rows.
+    Used by planners that evaluate many candidate poses at once.
+    """
+    __slots__ = ("data",)
+
+    def __init__(self, n: int):
+        self.data = np.zeros((n, 3), dtype=np.float32)
+
+    @classmethod
+    def _from_data(cls, data: np.ndarray) -> "RobotPoseArray":
+        """Wraps an existing (N, 3) float32 array without copying it."""
+        batch = cls.__new__(cls)
+        batch.data = data
+        return batch
+
+    @classmethod
+    def from_poses(cls, poses: Iterable[RobotPose]) -> "RobotPoseArray":
+        rows = [(pose.x, pose.y, pose.theta) for pose in poses]
+        return cls._from_data(np.array(rows, dtype=np.float32).reshape(len(rows), 3))
+
+    def __len__(self) -> int:
+        return self.data.shape[0]
+
+    def __getitem__(self, index: int) -> RobotPose:
+        x, y, theta = self.data[index]
+        return RobotPose(float(x), float(y), float(theta))
+
+    def transform(self, dx: float, dy: float, dtheta: float) -> "RobotPoseArray":
+        """Returns a new batch with the same robot-frame motion applied to every pose (see pose_ops.transform)."""
+        return RobotPoseArray._from_data(pose_ops.transform(self.data, np.float32(dx), np.float32(dy), np.float32(dtheta)))
+
+    def __repr__(self):
+        return "RobotPoseArray(n=%d)" % len(self)
+
+
+@dataclass(slots=True, frozen=True, repr=False)
 class AI_Service_Status:
     """Represents the operational status of an AI service."""
-    def __init__(self, service_name: str, is_ready: bool, error_message: Optional[str] = None):
-        self.service_name = service_name
-        self.is_ready = is_ready
-        self.error_message = error_message
+    service_name: str
+    is_ready: bool
+    error_message: Optional[str] = None
 
     def to_dict(self) -> Dict:
         return {"service_name": self.service_name, "is_ready": self.is_ready, "error_message": self.error_message}
 
-    def __str__(self):
+    def __repr__(self):
+        return "AI_Service_Status(%r,%r,%r)" % (self.service_name, self.is_ready, self.error_message)
+
+    def format(self) -> str:
         status = "Ready" if self.is_ready else f"Not Ready ({self.error_message})"
         return f"Service Status: {self.service_name} is {status}"
 
@@ -66,20 +139,25 @@ class ASR_API:
     Interface for Automatic Speech Recognition (ASR) services.
     Converts spoken audio into text.
     """
+    # Immutable status returned by every get_status() poll (the mock is always ready).
+    _READY_STATUS = AI_Service_Status("ASR Service", is_ready=True)
+
     def recognize_speech(self, audio_data: bytes, lang_code: str = "ar-SA") -> Optional[str]:
         """
         [MOCK] Defines the function to convert raw audio bytes into a text string.
         (No actual processing or input expected at this stage.)
         """
-        print(f"[ASR_API]: Method 'recognize_speech' called with dummy audio data ({len(audio_data)} bytes).")
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug("[ASR_API]: Method 'recognize_speech' called with dummy audio data (%d bytes).", len(audio_data))
         return "Dummy Recognized Text" # Always return a dummy value
 
     def get_status(self) -> AI_Service_Status:
         """
         [MOCK] Defines the function to check the current operational status of the ASR service.
         """
-        print("[ASR_API]: Method 'get_status' called.")
-        return AI_Service_Status("ASR Service", is_ready=True)
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug("[ASR_API]: Method 'get_status' called.")
+        return self._READY_STATUS
 
 
 class TTS_API:
@@ -87,20 +165,56 @@ class TTS_API:
     Interface for Text-To-Speech (TTS) services.
     Converts text strings into playable audio data.
     """
+    # Immutable status returned by every get_status() poll (the mock is always ready).
+    _READY_STATUS = AI_Service_Status("TTS Service", is_ready=True)
+
     def synthesize_speech(self, text: str, lang_code: str = "ar-SA", voice_id: str = "default_female") -> Optional[bytes]:
         """
         [MOCK] Defines the function to synthesize audio data from a given text string.
         (No actual audio generation at this stage.)
         """
-        print(f"[TTS_API]: Method 'synthesize_speech' called for text: '{text}'.")
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug("[TTS_API]: Method 'synthesize_speech' called for text: '%s'.", text)
         return b"dummy_audio_bytes" # Always return dummy audio bytes
 
     def get_status(self) -> AI_Service_Status:
         """
         [MOCK] Defines the function to check the current operational status of the TTS service.
         """
-        print("[TTS_API]: Method 'get_status' called.")
-        return AI_Service_Status("TTS Service", is_ready=True)
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug("[TTS_API]: Method 'get_status' called.")
+        return self._READY_STATUS
+
+
+# CV processing kernels. The image shape is destructured once by the CV_API
+# method and passed in as plain ints (h, w), so future @njit kernels with the
+# same (img, h, w) signature get one cached specialization per dtype/layout.
+
+def _detect_faces_impl(image_frame: np.ndarray, h: int, w: int) -> Dict[str, np.ndarray]:
+    """[MOCK] Face detection kernel behind CV_API.detect_faces."""
+    bbox = np.array([[0, 0, 10, 10]], dtype=np.int32)
+    confidence = np.zeros(1, dtype=np.float32)
+    face_ids = np.array(["dummy"], dtype=object)
+    return {"bbox": bbox, "confidence": confidence, "id": face_ids} # Return dummy data
+
+
+def _recognize_object_impl(image_frame: np.ndarray, h: int, w: int,
+                           object_list: Optional[List[str]]) -> List[Dict]:
+    """[MOCK] Object recognition kernel behind CV_API.recognize_object."""
+    return [] # Return empty list
+
+
+def detections_to_dicts(detections: Dict[str, np.ndarray]) -> List[Dict]:
+    """
+    Converts a detect_faces() struct-of-arrays result into the per-face list form
+    [{"bbox": {...}, "confidence": float, "id": ...}, ...] for consumers that need it.
+    Rows are converted with tolist() once, and no BoundingBox instances are created.
+    """
+    dict_from_xyxy = BoundingBox.dict_from_xyxy
+    return [{"bbox": dict_from_xyxy(x0, y0, x1, y1), "confidence": c, "id": id_}
+            for (x0, y0, x1, y1), c, id_ in zip(detections["bbox"].tolist(),
+                                                 detections["confidence"].tolist(),
+                                                 detections["id"].tolist())]
 
 
 class CV_API:
@@ -108,27 +222,55 @@ class CV_API:
     Interface for Computer Vision (CV) services.
     Performs visual analysis of image frames.
     """
-    def detect_faces(self, image_frame: np.ndarray) -> List[Dict]:
+    # Immutable status returned by every get_status() poll (the mock is always ready).
+    _READY_STATUS = AI_Service_Status("CV Service", is_ready=True)
+
+    # IoU above which overlapping detections are merged by non-max suppression.
+    # float32 to match the nms() specialization compiled by cv_postprocess.warm_up().
+    NMS_IOU_THRESHOLD = np.float32(0.5)
+
+    def warm_up(self) -> None:
+        """
+        Compiles (or loads from cache) the post-processing kernels so the first
+        real frame does not pay the JIT cost. Call once at process start.
+        """
+        cv_postprocess.warm_up()
+
+    def detect_faces(self, image_frame: np.ndarray) -> Dict[str, np.ndarray]:
         """
         [MOCK] Defines the function to detect human faces within an image frame.
         (No actual image processing or input expected at this stage.)
+
+        The canonical output is struct-of-arrays, one row per detected face (N faces):
+          "bbox":       (N, 4) int32 array of (x_min, y_min, x_max, y_max)
+          "confidence": (N,) float32 array
+          "id":         (N,) object array of face identifiers
+        Use BoundingBox.from_row() to get a single box back as an object.
         """
-        print(f"[CV_API]: Method 'detect_faces' called with dummy image (shape: {image_frame.shape}).")
-        return [{"bbox": BoundingBox(0, 0, 10, 10).to_dict(), "confidence": 0.0, "id": "dummy"}] # Return dummy data
+        h, w = image_frame.shape[:2]
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug("[CV_API]: Method 'detect_faces' called with dummy image (%dx%d).", h, w)
+        return _detect_faces_impl(image_frame, h, w)
 
     def recognize_object(self, image_frame: np.ndarray, object_list: Optional[List[str]] = None) -> List[Dict]:
         """
         [MOCK] Defines the function to detect and recognize specific objects within an image frame.
         """
-        print(f"[CV_API]: Method 'recognize_object' called with dummy image (shape: {image_frame.shape}, looking for: {object_list}).")
-        return [] # Return empty list
+        h, w = image_frame.shape[:2]
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug("[CV_API]: Method 'recognize_object' called with dummy image (%dx%d, looking for: %s).",
+                       h, w, object_list)
+        # Real detectors will pass their raw (bbox, confidence) arrays through
+        # cv_postprocess.nms(bbox, confidence, self.NMS_IOU_THRESHOLD) here.
+        return _recognize_object_impl(image_frame, h, w, object_list)
 
     def get_status(self) -> AI_Service_Status:
         """
         [MOCK] Defines the function to check the current operational status of the Computer Vision service.
         """
-        print("[CV_API]: Method 'get_status' called.")
-        return AI_Service_Status("CV Service", is_ready=True)
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug("[CV_API]: Method 'get_status' called.")
+        return self._READY_STATUS
 
 
 class Navigation_API:
@@ -136,40 +278,93 @@ class Navigation_API:
     Interface for Navigation services.
     Handles robot localization, mapping, and path planning.
     """
+    # Immutable status returned by every get_status() poll (the mock is always ready).
+    _READY_STATUS = AI_Service_Status("Navigation Service", is_ready=True)
+
+    # Fixed dummy pose returned by get_current_pose() in mock mode.
+    _MOCK_POSE = RobotPose(x=0.0, y=0.0, theta=0.0)
+
+    def __init__(self):
+        # The occupancy grid is binary (0 = free, 1 = occupied), so it is stored
+        # bit-packed (np.packbits, row-major) together with its (rows, cols) shape.
+        self._map_shape: Tuple[int, int] = (1, 1)
+        self._map_packed = np.packbits(np.zeros(self._map_shape, dtype=np.uint8))
+        self._map_packed.setflags(write=False)
+        self._map_view = self._unpack_map()
+
+    def _unpack_map(self) -> np.ndarray:
+        """Expands the packed map into a read-only int8 grid of shape self._map_shape."""
+        rows, cols = self._map_shape
+        grid = np.unpackbits(self._map_packed, count=rows * cols).reshape(rows, cols).view(np.int8)
+        grid.setflags(write=False)
+        return grid
+
+    def warm_up(self) -> None:
+        """
+        Compiles (or loads from cache) the pose batch kernels so the first
+        planning cycle does not pay the JIT cost. Call once at process start.
+        """
+        pose_ops.warm_up()
+
     def get_current_pose(self) -> RobotPose:
         """
         [MOCK] Defines the function to retrieve the robot's current estimated pose.
         """
-        print("[Navigation_API]: Method 'get_current_pose' called.")
-        return RobotPose(x=0.0, y=0.0, theta=0.0) # Return a fixed dummy pose
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug("[Navigation_API]: Method 'get_current_pose' called.")
+        return self._MOCK_POSE # Return a fixed dummy pose
 
     def set_goal_pose(self, target_pose: RobotPose) -> bool:
         """
         [MOCK] Defines the function to send a command to navigate to a target pose.
         """
-        print(f"[Navigation_API]: Method 'set_goal_pose' called for dummy target X={target_pose.x:.2f}, Y={target_pose.y:.2f}.")
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug("[Navigation_API]: Method 'set_goal_pose' called for dummy target X=%.2f, Y=%.2f.",
+                       target_pose.x, target_pose.y)
+        return True # Always succeed
+
+    def set_goal_poses(self, target_poses: RobotPoseArray) -> bool:
+        """
+        [MOCK] Defines the function to send a sequence of target poses (waypoints) to navigate through.
+        """
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug("[Navigation_API]: Method 'set_goal_poses' called for %d dummy targets.", len(target_poses))
         return True # Always succeed
 
     def cancel_navigation(self) -> bool:
         """
         [MOCK] Defines the function to cancel any ongoing navigation task.
         """
-        print("[Navigation_API]: Method 'cancel_navigation' called.")
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug("[Navigation_API]: Method 'cancel_navigation' called.")
         return True
 
     def get_map_data(self) -> Optional[np.ndarray]:
         """
         [MOCK] Defines the function to retrieve current occupancy grid map data.
+        The returned grid is a cached read-only view; copy it before modifying.
         """
-        print("[Navigation_API]: Method 'get_map_data' called.")
-        return np.array([[0]], dtype=np.int8) # Return a minimal dummy map
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug("[Navigation_API]: Method 'get_map_data' called.")
+        return self._map_view # Return a minimal dummy map
+
+    def get_map_data_packed(self) -> Tuple[np.ndarray, Tuple[int, int]]:
+        """
+        [MOCK] Defines the function to retrieve the occupancy grid in bit-packed form.
+        Returns the read-only np.packbits buffer (row-major, 1 bit per cell) and the
+        (rows, cols) grid shape, for planners that operate on packed bits directly.
+        """
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug("[Navigation_API]: Method 'get_map_data_packed' called.")
+        return self._map_packed, self._map_shape
 
     def get_status(self) -> AI_Service_Status:
         """
         [MOCK] Defines the function to check the current operational status of the Navigation service.
         """
-        print("[Navigation_API]: Method 'get_status' called.")
-        return AI_Service_Status("Navigation Service", is_ready=True)
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug("[Navigation_API]: Method 'get_status' called.")
+        return self._READY_STATUS
 
 # =========================================================================
 # Demonstration of API Interface Instantiation (for screenshot)
@@ -177,6 +372,9 @@ class Navigation_API:
 # calling their methods without actual input, showing successful initialization.
 # =========================================================================
 if __name__ == "__main__":
+    # Show the per-method API call traces in the demo output.
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s", stream=sys.stdout)
+
     print("=================================================================")
     print("  AI API Interfaces - Initialization & Definition Demonstration  ")
     print("=================================================================\n")
@@ -187,6 +385,8 @@ if __name__ == "__main__":
         tts_api_instance = TTS_API()
         cv_api_instance = CV_API()
         nav_api_instance = Navigation_API()
+        cv_api_instance.warm_up()
+        nav_api_instance.warm_up()
         print("  All AI API instances created successfully.")
     except Exception as e:
         print(f"  ERROR: Failed to create API instances: {e}")
@@ -196,21 +396,21 @@ if __name__ == "__main__":
 
     # ASR API Test
     print("\n  ASR API Verification:")
-    print(f"    Status: {asr_api_instance.get_status()}")
+    print(f"    Status: {asr_api_instance.get_status().format()}")
     dummy_audio = b"some dummy audio data for ASR" # dummy input bytes
     asr_result = asr_api_instance.recognize_speech(dummy_audio, "ar-SA")
     print(f"    Recognize speech (output type: {type(asr_result)})")
 
     # TTS API Test
     print("\n  TTS API Verification:")
-    print(f"    Status: {tts_api_instance.get_status()}")
+    print(f"    Status: {tts_api_instance.get_status().format()}")
     dummy_text = "مرحباً يا روبوت!"
     tts_result = tts_api_instance.synthesize_speech(dummy_text, "ar-SA")
     print(f"    Synthesize speech (output type: {type(tts_result)})")
 
     # CV API Test
     print("\n  CV API Verification:")
-    print(f"    Status: {cv_api_instance.get_status()}")
+    print(f"    Status: {cv_api_instance.get_status().format()}")
     dummy_image_data = np.zeros((100, 100, 3), dtype=np.uint8) # dummy image array
     cv_faces_result = cv_api_instance.detect_faces(dummy_image_data)
     print(f"    Detect faces (output type: {type(cv_faces_result)})")
@@ -219,12 +419,15 @@ if __name__ == "__main__":
 
     # Navigation API Test
     print("\n  Navigation API Verification:")
-    print(f"    Status: {nav_api_instance.get_status()}")
+    print(f"    Status: {nav_api_instance.get_status().format()}")
     nav_pose_result = nav_api_instance.get_current_pose()
     print(f"    Get current pose (output type: {type(nav_pose_result)})")
     dummy_target_pose = RobotPose(x=1.0, y=1.0, theta=0.0)
     nav_set_goal_result = nav_api_instance.set_goal_pose(dummy_target_pose)
     print(f"    Set goal pose (output type: {type(nav_set_goal_result)})")
+    dummy_waypoints = RobotPoseArray.from_poses([dummy_target_pose]).transform(1.0, 0.0, 0.0)
+    nav_set_goals_result = nav_api_instance.set_goal_poses(dummy_waypoints)
+    print(f"    Set goal poses (output type: {type(nav_set_goals_result)})")
 
 
     print("\n=================================================================")
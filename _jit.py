@@ -0,0 +1,17 @@
+# _jit.py
+
+# Optional-Numba shim shared by the kernel modules (cv_postprocess, pose_ops).
+# With Numba installed, njit/prange are Numba's own, and cache=True keeps the
+# compiled code on disk so later imports skip the JIT step. Without Numba, njit
+# is a no-op decorator and prange is range, so the kernels run as plain Python:
+# slow, but the API stays importable.
+
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional; fall back to uncompiled Python.
+    prange = range
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
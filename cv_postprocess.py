@@ -0,0 +1,118 @@
+# cv_postprocess.py
+
+# Numeric post-processing helpers for CV_API detection outputs.
+# Boxes use the canonical detect_faces layout: an (N, 4) array of
+# (x_min, y_min, x_max, y_max) rows.
+# Kernels are compiled with Numba when available (see _jit.py).
+
+import numpy as np
+
+from _jit import njit, prange
+
+
+@njit(cache=True, fastmath=True)
+def _box_iou(ax0, ay0, ax1, ay1, bx0, by0, bx1, by1):
+    """IoU of two (x_min, y_min, x_max, y_max) boxes given as scalars."""
+    iw = min(ax1, bx1) - max(ax0, bx0)
+    ih = min(ay1, by1) - max(ay0, by0)
+    if iw <= 0.0 or ih <= 0.0:
+        return 0.0
+    inter = iw * ih
+    union = (ax1 - ax0) * (ay1 - ay0) + (bx1 - bx0) * (by1 - by0) - inter
+    if union <= 0.0:
+        return 0.0
+    return inter / union
+
+
+# Below this many box pairs (N * M) the serial kernel is faster than paying
+# for the parallel thread pool; face detection usually returns a handful of boxes.
+PARALLEL_MIN_PAIRS = 1 << 16
+
+
+@njit(cache=True, fastmath=True)
+def _iou_row(boxes_a, i, boxes_b, out):
+    """Fills out[i, :] with the IoU of boxes_a[i] against every box in boxes_b."""
+    ax0 = np.float32(boxes_a[i, 0])
+    ay0 = np.float32(boxes_a[i, 1])
+    ax1 = np.float32(boxes_a[i, 2])
+    ay1 = np.float32(boxes_a[i, 3])
+    for j in range(boxes_b.shape[0]):
+        out[i, j] = _box_iou(ax0, ay0, ax1, ay1,
+                             np.float32(boxes_b[j, 0]), np.float32(boxes_b[j, 1]),
+                             np.float32(boxes_b[j, 2]), np.float32(boxes_b[j, 3]))
+
+
+@njit(cache=True, fastmath=True)
+def _iou_matrix_serial(boxes_a, boxes_b):
+    out = np.zeros((boxes_a.shape[0], boxes_b.shape[0]), dtype=np.float32)
+    for i in range(boxes_a.shape[0]):
+        _iou_row(boxes_a, i, boxes_b, out)
+    return out
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _iou_matrix_parallel(boxes_a, boxes_b):
+    out = np.zeros((boxes_a.shape[0], boxes_b.shape[0]), dtype=np.float32)
+    for i in prange(boxes_a.shape[0]):
+        _iou_row(boxes_a, i, boxes_b, out)
+    return out
+
+
+def iou_matrix(boxes_a, boxes_b):
+    """
+    Computes pairwise IoU between two box arrays.
+    Returns an (N, M) float32 array for N = len(boxes_a), M = len(boxes_b).
+    Rows are computed in parallel only when N * M >= PARALLEL_MIN_PAIRS.
+    """
+    if boxes_a.shape[0] * boxes_b.shape[0] >= PARALLEL_MIN_PAIRS:
+        return _iou_matrix_parallel(boxes_a, boxes_b)
+    return _iou_matrix_serial(boxes_a, boxes_b)
+
+
+@njit(cache=True, fastmath=True)
+def nms(boxes, scores, thresh):
+    """
+    Greedy non-max suppression.
+    Returns the indices of the kept boxes, highest score first (ties keep input
+    order). A box is dropped when its IoU with an already kept box is greater
+    than `thresh`.
+    """
+    order = np.argsort(-scores, kind="mergesort")
+    n = order.shape[0]
+    suppressed = np.zeros(n, dtype=np.bool_)
+    keep = np.empty(n, dtype=np.int64)
+    n_keep = 0
+    for oi in range(n):
+        i = order[oi]
+        if suppressed[i]:
+            continue
+        keep[n_keep] = i
+        n_keep += 1
+        ax0 = np.float32(boxes[i, 0])
+        ay0 = np.float32(boxes[i, 1])
+        ax1 = np.float32(boxes[i, 2])
+        ay1 = np.float32(boxes[i, 3])
+        for oj in range(oi + 1, n):
+            j = order[oj]
+            if suppressed[j]:
+                continue
+            iou = _box_iou(ax0, ay0, ax1, ay1,
+                           np.float32(boxes[j, 0]), np.float32(boxes[j, 1]),
+                           np.float32(boxes[j, 2]), np.float32(boxes[j, 3]))
+            if iou > thresh:
+                suppressed[j] = True
+    return keep[:n_keep]
+
+
+def warm_up() -> None:
+    """
+    Runs each kernel once on tiny inputs of the canonical dtypes (int32 boxes,
+    float32 scores, float32 threshold) so the JIT/cache-load cost is paid at
+    start-up rather than on the first real frame. Callers must pass the same
+    dtypes, or Numba compiles a new specialization on first use.
+    """
+    boxes = np.array([[0, 0, 10, 10], [1, 1, 11, 11]], dtype=np.int32)
+    scores = np.array([0.9, 0.8], dtype=np.float32)
+    _iou_matrix_serial(boxes, boxes)
+    _iou_matrix_parallel(boxes, boxes)
+    nms(boxes, scores, np.float32(0.5))
@@ -0,0 +1,66 @@
+# pose_ops.py
+
+# Vectorized kernels over batches of robot poses.
+# A pose batch is an (N, 3) float32 array of (x, y, theta) rows, as stored by
+# RobotPoseArray in API_AI_Design.py.
+# Kernels are compiled with Numba when available (see _jit.py).
+
+import numpy as np
+
+from _jit import njit, prange
+
+
+# Below this many poses the serial kernel is faster than paying for the
+# parallel thread pool (e.g. the single-pose moves of the demo).
+PARALLEL_MIN_POSES = 1 << 14
+
+
+@njit(cache=True, fastmath=True)
+def _transform_row(poses, i, dx, dy, dtheta, out):
+    """Writes the moved pose for poses[i] into out[i]."""
+    theta = poses[i, 2]
+    c = np.cos(theta)
+    s = np.sin(theta)
+    out[i, 0] = poses[i, 0] + dx * c - dy * s
+    out[i, 1] = poses[i, 1] + dx * s + dy * c
+    out[i, 2] = (theta + dtheta + np.pi) % (2.0 * np.pi) - np.pi
+
+
+@njit(cache=True, fastmath=True)
+def _transform_serial(poses, dx, dy, dtheta):
+    out = np.empty((poses.shape[0], 3), dtype=np.float32)
+    for i in range(poses.shape[0]):
+        _transform_row(poses, i, dx, dy, dtheta, out)
+    return out
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _transform_parallel(poses, dx, dy, dtheta):
+    out = np.empty((poses.shape[0], 3), dtype=np.float32)
+    for i in prange(poses.shape[0]):
+        _transform_row(poses, i, dx, dy, dtheta, out)
+    return out
+
+
+def transform(poses, dx, dy, dtheta):
+    """
+    Applies the same robot-frame motion to every pose in one pass.
+    (dx, dy) is a translation expressed in each pose's own frame (dx forward,
+    dy to the left) and dtheta a rotation; theta is wrapped to [-pi, pi).
+    Returns a new (N, 3) float32 array. Rows are computed in parallel only
+    when N >= PARALLEL_MIN_POSES.
+    """
+    if poses.shape[0] >= PARALLEL_MIN_POSES:
+        return _transform_parallel(poses, dx, dy, dtheta)
+    return _transform_serial(poses, dx, dy, dtheta)
+
+
+def warm_up() -> None:
+    """
+    Runs each kernel once on a tiny float32 batch so the JIT/cache-load cost is
+    paid at start-up rather than on the first planning cycle.
+    """
+    poses = np.zeros((1, 3), dtype=np.float32)
+    zero = np.float32(0.0)
+    _transform_serial(poses, zero, zero, zero)
+    _transform_parallel(poses, zero, zero, zero)
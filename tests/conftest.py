@@ -0,0 +1,40 @@
+import importlib
+import os
+import sys
+
+import pytest
+
+# The API modules live at the repository root, not in an installed package.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Modules that bind to Numba (or its fallback) at import time.
+_JIT_MODULES = ("_jit", "cv_postprocess", "pose_ops")
+
+
+@pytest.fixture(params=["numba", "no_numba"])
+def jit_module(request, monkeypatch):
+    """
+    Returns a factory that imports a kernel module either normally (compiled with
+    Numba) or with Numba hidden, so the plain-Python fallback is exercised too.
+    """
+    absent_before = []
+
+    def load(name):
+        if request.param == "numba":
+            pytest.importorskip("numba")
+            return importlib.import_module(name)
+        monkeypatch.setitem(sys.modules, "numba", None)
+        for mod in _JIT_MODULES + (name,):
+            if mod in absent_before:
+                sys.modules.pop(mod, None)
+            elif mod in sys.modules:
+                monkeypatch.delitem(sys.modules, mod)
+            else:
+                absent_before.append(mod)
+        return importlib.import_module(name)
+
+    yield load
+    # Fallback copies of modules that were not imported before the test would
+    # otherwise stay in sys.modules and leak into later Numba runs.
+    for mod in absent_before:
+        sys.modules.pop(mod, None)
@@ -0,0 +1,98 @@
+import numpy as np
+import pytest
+
+from API_AI_Design import (BoundingBox, CV_API, Navigation_API, RobotPose, RobotPoseArray,
+                           detections_to_dicts)
+
+
+def test_detect_faces_returns_struct_of_arrays():
+    faces = CV_API().detect_faces(np.zeros((100, 100, 3), dtype=np.uint8))
+    assert set(faces) == {"bbox", "confidence", "id"}
+    n = faces["bbox"].shape[0]
+    assert faces["bbox"].dtype == np.int32 and faces["bbox"].shape == (n, 4)
+    assert faces["confidence"].dtype == np.float32 and faces["confidence"].shape == (n,)
+    assert faces["id"].dtype == object and faces["id"].shape == (n,)
+
+
+def test_detect_faces_accepts_grayscale_frame():
+    faces = CV_API().detect_faces(np.zeros((100, 100), dtype=np.uint8))
+    assert faces["bbox"].shape[1] == 4
+
+
+def test_bounding_box_row_round_trip():
+    box = BoundingBox(1, 2, 30, 40)
+    row = box.to_row()
+    assert row.dtype == np.int32 and row.shape == (4,)
+    assert BoundingBox.from_row(row) == box
+
+
+@pytest.fixture
+def nav_with_map():
+    # 3x5 = 15 cells, deliberately not a multiple of 8, so the last packed byte is padded.
+    grid = np.array([[1, 0, 0, 1, 1],
+                     [0, 1, 0, 0, 0],
+                     [1, 1, 1, 0, 1]], dtype=np.uint8)
+    nav = Navigation_API()
+    nav._map_shape = grid.shape
+    nav._map_packed = np.packbits(grid)
+    nav._map_packed.setflags(write=False)
+    nav._map_view = nav._unpack_map()
+    return nav, grid
+
+
+def test_packed_map_round_trips(nav_with_map):
+    nav, grid = nav_with_map
+    packed, shape = nav.get_map_data_packed()
+    assert shape == (3, 5)
+    np.testing.assert_array_equal(np.unpackbits(packed, count=15).reshape(shape), grid)
+    np.testing.assert_array_equal(nav.get_map_data(), grid)
+
+
+def test_map_data_is_cached_read_only_int8(nav_with_map):
+    nav, _ = nav_with_map
+    grid = nav.get_map_data()
+    assert grid.dtype == np.int8
+    assert nav.get_map_data() is grid
+    with pytest.raises(ValueError):
+        grid[0, 0] = 1
+
+
+def test_packed_map_is_read_only(nav_with_map):
+    nav, _ = nav_with_map
+    packed, _ = nav.get_map_data_packed()
+    with pytest.raises(ValueError):
+        packed[0] = 0
+
+
+def test_pose_array_from_no_poses():
+    batch = RobotPoseArray.from_poses([])
+    assert batch.data.shape == (0, 3) and batch.data.dtype == np.float32
+    assert len(batch) == 0
+
+
+def test_pose_array_index_round_trips_pose():
+    pose = RobotPose(1.5, -2.25, 0.5)
+    batch = RobotPoseArray.from_poses([RobotPose(0.0, 0.0, 0.0), pose])
+    assert batch[1] == pose
+
+
+def test_pose_array_transform_returns_new_batch():
+    batch = RobotPoseArray.from_poses([RobotPose(1.0, 2.0, 0.0)])
+    before = batch.data.copy()
+    moved = batch.transform(1.0, 0.0, 0.0)
+    assert moved is not batch and moved.data is not batch.data
+    np.testing.assert_array_equal(batch.data, before)
+    assert moved[0] == RobotPose(2.0, 2.0, 0.0)
+
+
+def test_detections_to_dicts_matches_per_face_list_form():
+    faces = detections_to_dicts(CV_API().detect_faces(np.zeros((100, 100, 3), dtype=np.uint8)))
+    assert faces == [{"bbox": {"x_min": 0, "y_min": 0, "x_max": 10, "y_max": 10}, "confidence": 0.0, "id": "dummy"}]
+    face = faces[0]
+    assert all(type(v) is int for v in face["bbox"].values())
+    assert type(face["confidence"]) is float
+    assert type(face["id"]) is str
+
+
+def test_dict_from_xyxy_matches_to_dict():
+    assert BoundingBox.dict_from_xyxy(1, 2, 30, 40) == BoundingBox(1, 2, 30, 40).to_dict()
@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+
+
+@pytest.fixture
+def cvp(jit_module):
+    return jit_module("cv_postprocess")
+
+
+def boxes(*rows):
+    return np.array(rows, dtype=np.int32).reshape(len(rows), 4)
+
+
+def test_iou_identical_boxes(cvp):
+    b = boxes([0, 0, 10, 10])
+    assert cvp.iou_matrix(b, b)[0, 0] == pytest.approx(1.0)
+
+
+def test_iou_disjoint_boxes(cvp):
+    assert cvp.iou_matrix(boxes([0, 0, 10, 10]), boxes([20, 20, 30, 30]))[0, 0] == 0.0
+
+
+def test_iou_touching_boxes(cvp):
+    a = boxes([0, 0, 10, 10])
+    assert cvp.iou_matrix(a, boxes([10, 0, 20, 10]))[0, 0] == 0.0
+    assert cvp.iou_matrix(a, boxes([10, 10, 20, 20]))[0, 0] == 0.0
+
+
+def test_iou_partial_overlap(cvp):
+    # Intersection 9x9 = 81, union 100 + 100 - 81 = 119.
+    iou = cvp.iou_matrix(boxes([0, 0, 10, 10]), boxes([1, 1, 11, 11]))[0, 0]
+    assert iou == pytest.approx(81 / 119, rel=1e-5)
+
+
+def test_iou_matrix_shape_and_dtype(cvp):
+    a = boxes([0, 0, 10, 10], [5, 5, 15, 15])
+    b = boxes([0, 0, 10, 10], [20, 20, 30, 30], [5, 0, 15, 10])
+    out = cvp.iou_matrix(a, b)
+    assert out.shape == (2, 3)
+    assert out.dtype == np.float32
+    np.testing.assert_allclose(out, cvp.iou_matrix(b, a).T)
+
+
+def test_iou_matrix_parallel_path_matches_serial(cvp, monkeypatch):
+    a = boxes([0, 0, 10, 10], [5, 5, 15, 15], [1, 1, 11, 11])
+    b = boxes([0, 0, 10, 10], [20, 20, 30, 30], [5, 0, 15, 10])
+    serial = cvp.iou_matrix(a, b)
+    monkeypatch.setattr(cvp, "PARALLEL_MIN_PAIRS", 0)
+    np.testing.assert_allclose(cvp.iou_matrix(a, b), serial)
+
+
+def test_nms_keeps_highest_score_first(cvp):
+    b = boxes([0, 0, 10, 10], [50, 50, 60, 60], [100, 100, 110, 110])
+    scores = np.array([0.2, 0.9, 0.5], dtype=np.float32)
+    assert cvp.nms(b, scores, np.float32(0.5)).tolist() == [1, 2, 0]
+
+
+def test_nms_suppresses_overlap_above_threshold(cvp):
+    # IoU of the first two boxes is 81/119 ~= 0.68.
+    b = boxes([0, 0, 10, 10], [1, 1, 11, 11], [50, 50, 60, 60])
+    scores = np.array([0.5, 0.9, 0.7], dtype=np.float32)
+    assert cvp.nms(b, scores, np.float32(0.5)).tolist() == [1, 2]
+    assert cvp.nms(b, scores, np.float32(0.7)).tolist() == [1, 2, 0]
+
+
+def test_nms_ties_keep_input_order(cvp):
+    b = boxes(*[[20 * i, 0, 20 * i + 10, 10] for i in range(20)])
+    scores = np.full(20, 0.5, dtype=np.float32)
+    scores[7] = 0.9
+    assert cvp.nms(b, scores, np.float32(0.5)).tolist() == [7] + [i for i in range(20) if i != 7]
+
+
+def test_nms_empty_input(cvp):
+    out = cvp.nms(np.zeros((0, 4), dtype=np.int32), np.zeros(0, dtype=np.float32), np.float32(0.5))
+    assert out.shape == (0,)
+
+
+def test_warm_up_runs(cvp):
+    cvp.warm_up()
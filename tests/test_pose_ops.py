@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+
+@pytest.fixture
+def po(jit_module):
+    return jit_module("pose_ops")
+
+
+def poses(*rows):
+    return np.array(rows, dtype=np.float32).reshape(len(rows), 3)
+
+
+def move(po, batch, dx, dy, dtheta):
+    return po.transform(batch, np.float32(dx), np.float32(dy), np.float32(dtheta))
+
+
+def test_forward_move_at_theta_zero(po):
+    np.testing.assert_allclose(move(po, poses([1, 2, 0]), 1, 0, 0), [[2, 2, 0]], atol=1e-6)
+
+
+def test_forward_move_at_theta_half_pi(po):
+    out = move(po, poses([1, 2, np.pi / 2]), 1, 0, 0)
+    np.testing.assert_allclose(out, [[1, 3, np.pi / 2]], atol=1e-6)
+
+
+def test_lateral_move_goes_left(po):
+    np.testing.assert_allclose(move(po, poses([0, 0, 0]), 0, 1, 0), [[0, 1, 0]], atol=1e-6)
+    np.testing.assert_allclose(move(po, poses([0, 0, np.pi / 2]), 0, 1, 0), [[-1, 0, np.pi / 2]], atol=1e-6)
+
+
+def test_theta_wraps_past_pi(po):
+    out = move(po, poses([0, 0, 3.0], [0, 0, -3.0]), 0, 0, 0.5)
+    np.testing.assert_allclose(out[:, 2], [3.5 - 2 * np.pi, -2.5], atol=1e-5)
+    assert np.all((out[:, 2] >= -np.pi) & (out[:, 2] < np.pi))
+
+
+def test_output_is_new_float32_batch(po):
+    batch = poses([0, 0, 0], [1, 1, 1], [2, 2, 2])
+    out = move(po, batch, 1, 0, 0)
+    assert out.shape == (3, 3) and out.dtype == np.float32
+    assert out is not batch
+
+
+def test_empty_batch(po):
+    out = move(po, np.zeros((0, 3), dtype=np.float32), 1, 0, 0)
+    assert out.shape == (0, 3) and out.dtype == np.float32
+
+
+def test_parallel_path_matches_serial(po, monkeypatch):
+    batch = poses([0, 0, 0], [1, 2, 1.5], [-3, 4, -2.5])
+    serial = move(po, batch, 0.5, -0.25, 1.0)
+    monkeypatch.setattr(po, "PARALLEL_MIN_POSES", 0)
+    np.testing.assert_allclose(move(po, batch, 0.5, -0.25, 1.0), serial)
+
+
+def test_warm_up_runs(po):
+    po.warm_up()